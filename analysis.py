@@ -7,63 +7,156 @@ import subprocess
 import time
 import os
 import sys
-import glob
+import selectors
+import signal
+import csv
+import tempfile
 from pathlib import Path
-import matplotlib.pyplot as plt
-import numpy as np
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def measure_execution_time(command):
+def spawn_process(command, timeout, capture=True):
+    """
+    Run a command with os.posix_spawn and capture its output
+
+    posix_spawn avoids duplicating the interpreter's page tables the way
+    fork+exec in subprocess.run does. The timeout is enforced by selecting
+    on the output pipes and a pidfd for the child rather than with a
+    signal, so this is safe to call from worker threads. Requires Linux
+    with os.pidfd_open.
+
+    Args:
+        command (list): Command to execute as a list of strings
+        timeout (float): Seconds to wait before killing the child
+        capture (bool): Capture stdout; when False it goes to /dev/null
+
+    Returns:
+        subprocess.CompletedProcess with stdout/stderr as bytes
+        (stdout is None when not captured)
+
+    Raises:
+        subprocess.TimeoutExpired: if the child outlives the timeout
+    """
+    err_r, err_w = os.pipe()
+    read_fds, write_fds = [err_r], [err_w]
+    file_actions = [(os.POSIX_SPAWN_DUP2, err_w, 2)]
+    if capture:
+        out_r, out_w = os.pipe()
+        read_fds.append(out_r)
+        write_fds.append(out_w)
+        file_actions.append((os.POSIX_SPAWN_DUP2, out_w, 1))
+    else:
+        file_actions.append((os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0))
+    try:
+        pid = os.posix_spawn(command[0], command, os.environ, file_actions=file_actions)
+    except BaseException:
+        for fd in read_fds:
+            os.close(fd)
+        raise
+    finally:
+        for fd in write_fds:
+            os.close(fd)
+
+    chunks = {fd: [] for fd in read_fds}
+    deadline = time.monotonic() + timeout
+    pidfd = None
+    reaped = False
+    try:
+        # A pidfd becomes readable when the child exits, so one select()
+        # waits for both pipe EOF and exit under the same deadline
+        pidfd = os.pidfd_open(pid)
+        with selectors.DefaultSelector() as sel:
+            for fd in chunks:
+                sel.register(fd, selectors.EVENT_READ)
+            sel.register(pidfd, selectors.EVENT_READ)
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(command, timeout)
+                for key, _ in sel.select(remaining):
+                    if key.fd == pidfd:
+                        sel.unregister(pidfd)
+                        continue
+                    data = os.read(key.fd, 65536)
+                    if data:
+                        chunks[key.fd].append(data)
+                    else:
+                        sel.unregister(key.fd)
+
+        _, status = os.waitpid(pid, 0)
+        reaped = True
+    finally:
+        for fd in chunks:
+            os.close(fd)
+        if pidfd is not None:
+            os.close(pidfd)
+        if not reaped:
+            # Timed out or interrupted: don't leave the child running
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+
+    stdout = b"".join(chunks[out_r]) if capture else None
+    return subprocess.CompletedProcess(command, os.waitstatus_to_exitcode(status),
+                                       stdout, b"".join(chunks[err_r]))
+
+def measure_execution_time(command, capture=False, cwd=None):
     """
     Measure the execution time of a command
     
     Args:
         command (list): Command to execute as a list of strings
+        capture (bool): Capture stdout instead of discarding it to /dev/null
+        cwd (str): Directory to run the command in. posix_spawn cannot
+                   change directory, so this goes through subprocess.run
     
     Returns:
         tuple: (execution_time_seconds, return_code, stdout, stderr)
+               stdout/stderr are raw bytes (stdout is None unless captured);
+               on timeout or launch failure stderr is the str "TIMEOUT" or
+               the exception message
     """
-    start_time = time.time()
+    start = time.perf_counter_ns()
     
     try:
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=60  # 60 second timeout
-        )
-        end_time = time.time()
-        execution_time = end_time - start_time
+        if cwd is None and hasattr(os, "posix_spawn") and hasattr(os, "pidfd_open"):
+            result = spawn_process(command, timeout=60, capture=capture)  # 60 second timeout
+        else:
+            result = subprocess.run(
+                command,
+                stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=False,
+                cwd=cwd,
+                timeout=60  # 60 second timeout
+            )
+        execution_time = (time.perf_counter_ns() - start) / 1e9
         
         return execution_time, result.returncode, result.stdout, result.stderr
     
     except subprocess.TimeoutExpired:
-        end_time = time.time()
-        execution_time = end_time - start_time
-        return execution_time, -1, "", "TIMEOUT"
+        execution_time = (time.perf_counter_ns() - start) / 1e9
+        return execution_time, -1, b"", "TIMEOUT"
     
     except Exception as e:
-        end_time = time.time()
-        execution_time = end_time - start_time
-        return execution_time, -1, "", str(e)
+        execution_time = (time.perf_counter_ns() - start) / 1e9
+        return execution_time, -1, b"", str(e)
 
-def get_file_size(filepath):
-    """Get file size in bytes"""
-    try:
-        return os.path.getsize(filepath)
-    except OSError:
-        return 0
+def decode_output(output):
+    """Decode captured process output for display"""
+    if isinstance(output, bytes):
+        return output.decode('utf-8', 'replace')
+    return output
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 def format_size(size_bytes):
     """Format file size in human readable format"""
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0B"
     
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f}{unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f}TB"
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    idx = min((size_bytes.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * idx)):.1f}{_UNITS[idx]}"
 
 def create_performance_plot(results, output_filename="performance_plot.png"):
     """
@@ -73,6 +166,12 @@ def create_performance_plot(results, output_filename="performance_plot.png"):
         results (list): List of result dictionaries from performance analysis
         output_filename (str): Name of the output plot file
     """
+    # Imported here so single-file runs and --help don't pay for them
+    import matplotlib
+    matplotlib.use('Agg')  # Plots are only written to file, no GUI backend needed
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
     # Filter for binary files only
     bin_results = [r for r in results if r['filename'].endswith('.bin') and r['status'] == 'SUCCESS']
     
@@ -81,46 +180,54 @@ def create_performance_plot(results, output_filename="performance_plot.png"):
         return
     
     # Extract data for plotting
-    file_sizes_mb = [r['size_bytes'] / (1024 * 1024) for r in bin_results]  # Convert to MB
-    exec_times = [r['time'] for r in bin_results]
+    arr = np.array([(r['size_bytes'], r['time']) for r in bin_results],
+                   dtype=[('size', 'i8'), ('time', 'f8')])
+    file_sizes_mb = arr['size'] / (1024 * 1024)  # Convert to MB
+    exec_times = arr['time']
     filenames = [r['filename'] for r in bin_results]
     
     # Create the plot
-    plt.figure(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6))
     
     # Scatter plot with points
-    plt.scatter(file_sizes_mb, exec_times, color='blue', s=100, alpha=0.7, edgecolors='black')
+    ax.scatter(file_sizes_mb, exec_times, color='blue', s=100, alpha=0.7, edgecolors='black')
     
     # Add labels for each point
-    for i, filename in enumerate(filenames):
-        plt.annotate(filename, (file_sizes_mb[i], exec_times[i]), 
+    for filename, size_mb, exec_time in zip(filenames, file_sizes_mb, exec_times):
+        ax.annotate(filename, (size_mb, exec_time), 
                     textcoords="offset points", xytext=(0,10), ha='center', fontsize=9)
     
     # Add trend line
-    if len(file_sizes_mb) > 1:
-        z = np.polyfit(file_sizes_mb, exec_times, 1)
-        p = np.poly1d(z)
-        plt.plot(file_sizes_mb, p(file_sizes_mb), "r--", alpha=0.8, linewidth=2, 
-                label=f'Trend line: y = {z[0]:.3f}x + {z[1]:.3f}')
-        plt.legend()
+    # Closed-form least squares for a degree-1 fit
+    x, y = file_sizes_mb, exec_times
+    n = len(x)
+    sx, sy = x.sum(), y.sum()
+    sxx, sxy = (x * x).sum(), (x * y).sum()
+    denom = n * sxx - sx * sx
+    if n > 1 and denom != 0:
+        slope = (n * sxy - sx * sy) / denom
+        intercept = (sy - slope * sx) / n
+        ax.plot(x, slope * x + intercept, "r--", alpha=0.8, linewidth=2, 
+                label=f'Trend line: y = {slope:.3f}x + {intercept:.3f}')
+        ax.legend()
     
     # Customize the plot
-    plt.xlabel('File Size (MB)', fontsize=12)
-    plt.ylabel('Execution Time (seconds)', fontsize=12)
-    plt.title('File Size vs Execution Time for Binary Files', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
+    ax.set_xlabel('File Size (MB)', fontsize=12)
+    ax.set_ylabel('Execution Time (seconds)', fontsize=12)
+    ax.set_title('File Size vs Execution Time for Binary Files', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
     
     # Add some statistics to the plot
     if len(bin_results) > 1:
         correlation = np.corrcoef(file_sizes_mb, exec_times)[0, 1]
-        plt.text(0.02, 0.98, f'Correlation coefficient: {correlation:.3f}', 
-                transform=plt.gca().transAxes, verticalalignment='top',
+        ax.text(0.02, 0.98, f'Correlation coefficient: {correlation:.3f}', 
+                transform=ax.transAxes, verticalalignment='top',
                 bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
     
     # Adjust layout and save
-    plt.tight_layout()
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_filename, dpi=150)
+    plt.close(fig)
     
     print(f"\nPerformance plot saved as '{output_filename}'")
     
@@ -128,42 +235,115 @@ def create_performance_plot(results, output_filename="performance_plot.png"):
     if len(bin_results) > 1:
         print(f"Binary files analysis:")
         print(f"  Files plotted: {len(bin_results)}")
-        print(f"  Size range: {min(file_sizes_mb):.1f} - {max(file_sizes_mb):.1f} MB")
-        print(f"  Time range: {min(exec_times):.3f} - {max(exec_times):.3f} seconds")
+        print(f"  Size range: {file_sizes_mb.min():.1f} - {file_sizes_mb.max():.1f} MB")
+        print(f"  Time range: {exec_times.min():.3f} - {exec_times.max():.3f} seconds")
         print(f"  Correlation coefficient: {correlation:.3f}")
         
         # Calculate throughput statistics
-        throughputs = [size_mb / time for size_mb, time in zip(file_sizes_mb, exec_times)]
-        avg_throughput = sum(throughputs) / len(throughputs)
+        throughputs = file_sizes_mb / exec_times
+        avg_throughput = throughputs.mean()
         print(f"  Average throughput: {avg_throughput:.2f} MB/s")
 
-def run_performance_analysis(m_value=None):
-    """Run performance analysis on various test files"""
+# Per-run fields kept in memory and written to the results CSV
+RESULT_FIELDS = ['filename', 'size_bytes', 'time', 'status', 'return_code']
+
+# Entries each isolated job needs in its scratch directory
+SCRATCH_LINKS = ('client', 'server', 'BIMDC')
+
+def _run_one(client_path, test_file, file_size, m_suffix, isolate=False):
+    """
+    Run the client once on a BIMDC file
+    
+    The client and the server it forks use fixed FIFO names and write into
+    received/ in the working directory, so concurrent runs must not share
+    one. With isolate=True the run happens in its own temporary directory
+    holding symlinks to SCRATCH_LINKS and an empty received/. It is created
+    under the working directory so output lands on the same filesystem as
+    serial runs.
+    
+    Returns:
+        tuple: (result_dict, stderr) where result_dict holds RESULT_FIELDS;
+               stderr is returned separately so it isn't kept with the results
+    """
+    filename = test_file  # Already just the basename
+    
+    # Run the command (client expects just the filename, server adds BIMDC/ prefix)
+    command = [client_path, "-f", test_file, *m_suffix]
+    if isolate:
+        with tempfile.TemporaryDirectory(prefix="analysis-", dir=os.getcwd()) as scratch:
+            for name in SCRATCH_LINKS:
+                os.symlink(os.path.abspath(name), os.path.join(scratch, name))
+            os.mkdir(os.path.join(scratch, "received"))
+            exec_time, return_code, stdout, stderr = measure_execution_time(
+                command, capture=False, cwd=scratch)
+    else:
+        exec_time, return_code, stdout, stderr = measure_execution_time(command, capture=False)
+    
+    # Determine status
+    if return_code == 0:
+        status = "SUCCESS"
+    elif stderr == "TIMEOUT":
+        status = "TIMEOUT"
+    else:
+        status = "ERROR"
+    
+    result = {
+        'filename': filename,
+        'size_bytes': file_size,
+        'time': exec_time,
+        'status': status,
+        'return_code': return_code
+    }
+    return result, stderr
+
+def _print_result(result, stderr):
+    """Print one row of the performance table, plus the error for failed runs"""
+    print(f"{result['filename']:<25} {format_size(result['size_bytes']):<10} {result['time']:<10.3f} {result['status']:<10}")
+    if result['status'] == 'ERROR' and stderr:
+        print(f"  Error: {decode_output(stderr)}")
+
+def run_performance_analysis(m_value=None, jobs=1, csv_filename="results.csv"):
+    """
+    Run performance analysis on various test files
+    
+    Args:
+        m_value (int): Buffer size passed to the client with -m, if any
+        jobs (int): Number of client runs to execute concurrently, each in
+                    its own scratch directory. Values above 1 finish sooner
+                    but the timings contend for CPU and disk, so keep the
+                    default for representative numbers.
+        csv_filename (str): File each run's result is written to as it finishes
+    """
     
     # Check if client executable exists
     client_path = "./client"
-    if not os.path.exists(client_path):
-        print(f"Error: {client_path} not found. Make sure to build the client first.")
+    if not os.access(client_path, os.X_OK):
+        print(f"Error: {client_path} not found or not executable. Make sure to build the client first.")
         return
     
-    # Get test files from BIMDC directory
-    test_files = []
-    
-    # Add CSV files (just the filenames, server will add BIMDC/ prefix)
-    csv_files = glob.glob("BIMDC/*.csv")
-    test_files.extend([os.path.basename(f) for f in csv_files])
-    
-    # Add binary test files (just the filenames, server will add BIMDC/ prefix)  
-    bin_files = glob.glob("BIMDC/*.bin")
-    test_files.extend([os.path.basename(f) for f in bin_files])
+    # Get CSV and binary test files from BIMDC directory as (filename, size)
+    # pairs; the client only needs the filename, server will add BIMDC/ prefix.
+    # DirEntry caches its stat result, so each file is stat'ed once.
+    try:
+        with os.scandir("BIMDC") as it:
+            entries = [e for e in it if e.name.endswith(('.csv', '.bin')) and e.is_file()]
+    except FileNotFoundError:
+        entries = []
     
     # Sort files by size for better analysis
-    test_files.sort(key=lambda x: get_file_size(os.path.join("BIMDC", x)))
+    entries.sort(key=lambda e: e.stat().st_size)
+    test_files = [(e.name, e.stat().st_size) for e in entries]
     
     if not test_files:
         print("No test files found in BIMDC directory")
         return
     
+    # Arguments shared by every client invocation
+    m_suffix = ["-m", str(m_value)] if m_value is not None else []
+    
+    # Untimed warm-up run so loader and page-cache costs don't land on the first file
+    measure_execution_time([client_path, "-f", test_files[0][0], *m_suffix])
+    
     # Prepare command description for output
     cmd_desc = "./client -f {filename}"
     if m_value is not None:
@@ -176,51 +356,43 @@ def run_performance_analysis(m_value=None):
     
     results = []
     
-    for test_file in test_files:
-        filename = test_file  # Already just the basename
-        file_path = os.path.join("BIMDC", test_file)  # Full path for size calculation
-        file_size = get_file_size(file_path)
+    with open(csv_filename, 'w', newline='') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
         
-        # Run the command (client expects just the filename, server adds BIMDC/ prefix)
-        command = [client_path, "-f", test_file]
-        if m_value is not None:
-            command.extend(["-m", str(m_value)])
-        exec_time, return_code, stdout, stderr = measure_execution_time(command)
+        def record(result, stderr):
+            # Client output is reported here and then dropped
+            results.append(result)
+            writer.writerow(result)
+            _print_result(result, stderr)
         
-        # Determine status
-        if return_code == 0:
-            status = "SUCCESS"
-        elif stderr == "TIMEOUT":
-            status = "TIMEOUT"
+        if jobs > 1:
+            # Client runs are independent processes; threads just wait on them
+            with ThreadPoolExecutor(max_workers=jobs) as ex:
+                futs = {ex.submit(_run_one, client_path, tf, size, m_suffix, isolate=True): tf
+                        for tf, size in test_files}
+                for fut in as_completed(futs):
+                    record(*fut.result())
+            # Restore file-size order for the summary and plot
+            order = {tf: i for i, (tf, _) in enumerate(test_files)}
+            results.sort(key=lambda r: order[r['filename']])
         else:
-            status = "ERROR"
-        
-        # Store results
-        results.append({
-            'filename': filename,
-            'filepath': file_path,
-            'size_bytes': file_size,
-            'size_formatted': format_size(file_size),
-            'time': exec_time,
-            'status': status,
-            'return_code': return_code,
-            'stdout': stdout,
-            'stderr': stderr
-        })
-        
-        # Print result
-        print(f"{filename:<25} {format_size(file_size):<10} {exec_time:<10.3f} {status:<10}")
+            for test_file, file_size in test_files:
+                record(*_run_one(client_path, test_file, file_size, m_suffix))
     
     print("-" * 60)
+    print(f"Results written to '{csv_filename}'")
     
     # Summary statistics
     successful_runs = [r for r in results if r['status'] == 'SUCCESS']
     
     if successful_runs:
-        total_time = sum(r['time'] for r in successful_runs)
-        avg_time = total_time / len(successful_runs)
-        min_time = min(r['time'] for r in successful_runs)
-        max_time = max(r['time'] for r in successful_runs)
+        import numpy as np
+        times = np.array([r['time'] for r in successful_runs])
+        total_time = times.sum()
+        avg_time = times.mean()
+        min_time = times.min()
+        max_time = times.max()
         
         print(f"\nSummary (successful runs only):")
         print(f"  Total files tested: {len(test_files)}")
@@ -243,8 +415,6 @@ def run_performance_analysis(m_value=None):
         print(f"\nFailed Executions:")
         for result in failed_runs:
             print(f"  {result['filename']}: {result['status']}")
-            if result['stderr'] and result['stderr'] != "TIMEOUT":
-                print(f"    Error: {result['stderr']}")
     
     # Create performance plot for binary files
     create_performance_plot(results, "file_size_vs_time.png")
@@ -255,8 +425,8 @@ def test_single_file(filename, iterations=1, m_value=None):
     """Run test on a single file multiple times"""
     
     client_path = "./client"
-    if not os.path.exists(client_path):
-        print(f"Error: {client_path} not found. Make sure to build the client first.")
+    if not os.access(client_path, os.X_OK):
+        print(f"Error: {client_path} not found or not executable. Make sure to build the client first.")
         return
     
     # Check if file exists (handle both full path and just filename)
@@ -280,12 +450,15 @@ def test_single_file(filename, iterations=1, m_value=None):
     print("=" * 50)
     
     times = []
+    m_suffix = ["-m", str(m_value)] if m_value is not None else []
+    command = [client_path, "-f", client_filename, *m_suffix]
+    
+    # With enough iterations for statistics, discard one warm-up run first
+    if iterations >= 3:
+        measure_execution_time(command)
     
     for i in range(iterations):
-        command = [client_path, "-f", client_filename]
-        if m_value is not None:
-            command.extend(["-m", str(m_value)])
-        exec_time, return_code, stdout, stderr = measure_execution_time(command)
+        exec_time, return_code, stdout, stderr = measure_execution_time(command, capture=False)
         
         if return_code == 0:
             times.append(exec_time)
@@ -293,18 +466,38 @@ def test_single_file(filename, iterations=1, m_value=None):
         else:
             print(f"Run {i+1}: {exec_time:.3f} seconds - FAILED")
             if stderr:
-                print(f"  Error: {stderr}")
+                print(f"  Error: {decode_output(stderr)}")
     
     if times:
-        avg_time = sum(times) / len(times)
-        min_time = min(times)
-        max_time = max(times)
+        # Deferred until the timed runs are done
+        import numpy as np
+        times = np.array(times)
+        avg_time = times.mean()
+        min_time = times.min()
+        max_time = times.max()
         
         print(f"\nStatistics for {len(times)} successful runs:")
+        print(f"  Minimum time: {min_time:.3f} seconds (best estimate)")
         print(f"  Average time: {avg_time:.3f} seconds")
-        print(f"  Minimum time: {min_time:.3f} seconds")
         print(f"  Maximum time: {max_time:.3f} seconds")
-        print(f"  Standard deviation: {(sum((t - avg_time)**2 for t in times) / len(times))**0.5:.3f} seconds")
+        print(f"  Standard deviation: {np.std(times):.3f} seconds")
+
+def _positive_int(value):
+    """argparse type for -j: a positive integer"""
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return n
+
+def _cpu_index(value):
+    """argparse type for --pin: a CPU number between 0 and cpu_count - 1"""
+    cpu = int(value)
+    if cpu < 0:
+        raise argparse.ArgumentTypeError(f"CPU number must be non-negative, got {value}")
+    cpu_count = os.cpu_count()
+    if cpu_count is not None and cpu >= cpu_count:
+        raise argparse.ArgumentTypeError(f"CPU number must be less than {cpu_count}, got {value}")
+    return cpu
 
 def main():
     """Main function with command line argument handling"""
@@ -315,6 +508,8 @@ def main():
         epilog='''Examples:
   python3 analysis.py                     # Run full analysis on all files
   python3 analysis.py -m 256              # Run full analysis with -m 256
+  python3 analysis.py -j 4                # Run full analysis, 4 files at a time
+  python3 analysis.py --pin 2             # Run full analysis pinned to CPU 2
   python3 analysis.py -f test.bin         # Test single file once
   python3 analysis.py -f test.bin -i 5    # Test single file 5 times
   python3 analysis.py -f test.bin -m 512  # Test single file with -m 512
@@ -327,15 +522,33 @@ def main():
                         help='Test a single file instead of running full analysis')
     parser.add_argument('-i', '--iterations', type=int, default=1, metavar='N',
                         help='Number of iterations for single file testing (default: 1)')
+    parser.add_argument('-j', '--jobs', type=_positive_int, default=1, metavar='N',
+                        help='Number of files to test concurrently in full analysis (default: 1). '
+                             'Parallel runs finish sooner but skew individual timings')
+    parser.add_argument('--pin', type=_cpu_index, metavar='CPU',
+                        help='Pin the harness to this CPU for steadier timings; the client and '
+                             'its server inherit the pinning. Cannot be combined with -j')
     
     args = parser.parse_args()
     
+    if args.pin is not None and args.jobs > 1:
+        # Every job would share the one pinned CPU, defeating -j
+        parser.error("--pin cannot be combined with -j/--jobs greater than 1")
+    
+    if args.pin is not None:
+        # Spawned clients inherit the affinity mask
+        try:
+            os.sched_setaffinity(0, {args.pin})
+        except (AttributeError, OSError, OverflowError) as e:
+            print(f"Error: could not pin to CPU {args.pin}: {e}")
+            return
+    
     if args.file:
         # Test single file
         test_single_file(args.file, args.iterations, args.buffer_size)
     else:
         # Run full analysis
-        run_performance_analysis(args.buffer_size)
+        run_performance_analysis(args.buffer_size, args.jobs)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file